@@ -30,15 +30,154 @@ It checks:
 3. Required claims
 
 This provides a security layer BEFORE requests reach your microservice.
+
+Key Concept: Verification Cache
+-------------------------------
+Clients replay the same bearer token on every request for its whole lifetime.
+Successful verifications are cached for a few seconds (never past the token's
+own 'exp'), so a replayed token skips the base64/HMAC/JSON decode cycle.
+Failures are never cached.
 """
 
+import binascii
+import hashlib
+import hmac
+import threading
+import time
 import jwt
-from datetime import datetime, timezone
+import orjson
+import pybase64
+from cachetools import TLRUCache
 from functools import wraps
 from flask import request, jsonify
 from .config import Config
 
 
+# JWT settings resolved once at import instead of on every encode/decode
+# Only HS256 is issued/accepted (Config.JWT_ALGORITHM, Kong's jwt_secrets)
+_JWT_KEY = Config.JWT_SECRET_KEY.encode('utf-8')
+_JWT_REQUIRED_CLAIMS = ('exp', 'iat', 'sub')
+# Base64url of {"alg":"HS256","typ":"JWT"}; the header never changes
+_HEADER_B64 = b'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9'
+_JWT_EXP_SECONDS = int(Config.JWT_EXPIRATION.total_seconds())
+_ISS = 'user-service'
+
+# Verified-token cache: key is a 16-byte digest of the token (raw tokens are
+# never stored), value is the decoded payload. Each entry expires after
+# _VERIFY_CACHE_TTL seconds or at the token's 'exp', whichever comes first.
+_VERIFY_CACHE_TTL = 5
+_verify_cache = TLRUCache(
+    maxsize=10000,
+    # int(): 'exp' may be a numeric string in a validly signed token
+    ttu=lambda key, payload, now: min(int(payload['exp']), now + _VERIFY_CACHE_TTL),
+    timer=time.time
+)
+_verify_cache_lock = threading.Lock()
+
+
+# ============================================================================
+# HS256 encoding/decoding
+# ============================================================================
+# A minimal single-algorithm JWS implementation on top of hmac/hashlib
+# (OpenSSL SHA-256), pybase64 (SIMD base64) and orjson (compact JSON).
+# Tokens are equivalent to PyJWT's (same header, claims and signature
+# scheme), without PyJWT's algorithm dispatch. They are byte-identical only
+# for ASCII claims: orjson writes non-ASCII text as raw UTF-8 where PyJWT's
+# json.dumps escaped it as \uXXXX. Both forms decode to the same payload.
+# PyJWT's exception types are kept so errors read the same.
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encode without padding (RFC 7515)."""
+    return pybase64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Base64url-decode strictly, restoring the stripped padding."""
+    return pybase64.b64decode(data + b'=' * (-len(data) % 4), altchars=b'-_', validate=True)
+
+
+def _encode_hs256(payload: dict) -> str:
+    """Serialize and sign a payload as an HS256 JWT."""
+    payload_b64 = _b64url_encode(orjson.dumps(payload))
+    signing_input = _HEADER_B64 + b'.' + payload_b64
+    signature = hmac.new(_JWT_KEY, signing_input, 'sha256').digest()
+    return (signing_input + b'.' + _b64url_encode(signature)).decode('ascii')
+
+
+def _decode_hs256(token: str) -> dict:
+    """Verify an HS256 JWT signature and validate its registered claims."""
+    try:
+        signing_input, signature_b64 = token.encode('utf-8').rsplit(b'.', 1)
+        header_b64, payload_b64 = signing_input.split(b'.', 1)
+    except ValueError:
+        raise jwt.DecodeError('Not enough segments')
+    
+    # Segments are decoded in the same order as PyJWT so malformed tokens
+    # raise the same errors; tokens issued by this service carry exactly
+    # _HEADER_B64, so only foreign headers need to be parsed
+    header = None
+    if header_b64 != _HEADER_B64:
+        try:
+            header = orjson.loads(_b64url_decode(header_b64))
+        except (ValueError, binascii.Error) as e:
+            raise jwt.DecodeError(f'Invalid header string: {e}')
+        if not isinstance(header, dict):
+            raise jwt.DecodeError('Invalid header string: must be a json object')
+    try:
+        payload_json = _b64url_decode(payload_b64)
+    except (ValueError, binascii.Error):
+        raise jwt.DecodeError('Invalid payload padding')
+    try:
+        signature = _b64url_decode(signature_b64)
+    except (ValueError, binascii.Error):
+        raise jwt.DecodeError('Invalid crypto padding')
+    
+    if header is not None and header.get('alg') != 'HS256':
+        raise jwt.InvalidAlgorithmError('The specified alg value is not allowed')
+    expected = hmac.new(_JWT_KEY, signing_input, 'sha256').digest()
+    # Constant-time comparison prevents timing attacks on the signature
+    if not hmac.compare_digest(signature, expected):
+        raise jwt.InvalidSignatureError('Signature verification failed')
+    
+    try:
+        payload = orjson.loads(payload_json)
+    except ValueError as e:
+        raise jwt.DecodeError(f'Invalid payload string: {e}')
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError('Invalid payload string: must be a json object')
+    
+    for claim in _JWT_REQUIRED_CLAIMS:
+        if payload.get(claim) is None:
+            raise jwt.MissingRequiredClaimError(claim)
+    
+    now = time.time()
+    try:
+        iat = int(payload['iat'])
+    except (TypeError, ValueError):
+        raise jwt.InvalidIssuedAtError('Issued At claim (iat) must be an integer.')
+    if iat > now:
+        raise jwt.ImmatureSignatureError('The token is not yet valid (iat)')
+    if 'nbf' in payload:
+        try:
+            nbf = int(payload['nbf'])
+        except (TypeError, ValueError):
+            raise jwt.DecodeError('Not Before claim (nbf) must be an integer.')
+        if nbf > now:
+            raise jwt.ImmatureSignatureError('The token is not yet valid (nbf)')
+    try:
+        exp = int(payload['exp'])
+    except (TypeError, ValueError):
+        raise jwt.DecodeError('Expiration Time claim (exp) must be an integer.')
+    if exp <= now:
+        raise jwt.ExpiredSignatureError('Signature has expired')
+    
+    # No audience is configured, so (like PyJWT) any non-empty 'aud' is rejected
+    if payload.get('aud'):
+        raise jwt.InvalidAudienceError('Invalid audience')
+    
+    return payload
+
+
 def create_jwt_token(user_id: int, username: str) -> str:
     """
     Create a JWT token for an authenticated user.
@@ -57,22 +196,17 @@ def create_jwt_token(user_id: int, username: str) -> str:
     - exp: Expiration timestamp
     - iss: Token issuer identifier
     """
-    now = datetime.now(timezone.utc)
-    expiration = now + Config.get_jwt_expiration()
+    now_ts = int(time.time())
     
     payload = {
         'sub': str(user_id),           # Subject (user identifier)
         'username': username,           # Custom claim for username
-        'iat': now,                     # Issued at
-        'exp': expiration,              # Expiration time
-        'iss': 'user-service'           # Issuer (this service)
+        'iat': now_ts,                  # Issued at (Unix timestamp)
+        'exp': now_ts + _JWT_EXP_SECONDS,  # Expiration time (Unix timestamp)
+        'iss': _ISS                     # Issuer (this service)
     }
     
-    token = jwt.encode(
-        payload,
-        Config.JWT_SECRET_KEY,
-        algorithm=Config.JWT_ALGORITHM
-    )
+    token = _encode_hs256(payload)
     
     return token
 
@@ -91,12 +225,7 @@ def decode_jwt_token(token: str) -> dict:
         jwt.ExpiredSignatureError: If token has expired
         jwt.InvalidTokenError: If token is invalid
     """
-    payload = jwt.decode(
-        token,
-        Config.JWT_SECRET_KEY,
-        algorithms=[Config.JWT_ALGORITHM],
-        options={'require': ['exp', 'iat', 'sub']}
-    )
+    payload = _decode_hs256(token)
     return payload
 
 
@@ -109,9 +238,19 @@ def verify_jwt_token(token: str) -> tuple:
         
     Returns:
         Tuple of (is_valid: bool, payload_or_error: dict/str)
+    
+    Successful results are served from a short-lived cache on repeat calls.
     """
+    cache_key = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+    with _verify_cache_lock:
+        payload = _verify_cache.get(cache_key)
+    if payload is not None:
+        return True, payload
+    
     try:
         payload = decode_jwt_token(token)
+        with _verify_cache_lock:
+            _verify_cache[cache_key] = payload
         return True, payload
     except jwt.ExpiredSignatureError:
         return False, 'Token has expired'
@@ -119,12 +258,43 @@ def verify_jwt_token(token: str) -> tuple:
         return False, f'Invalid token: {str(e)}'
 
 
+def extract_bearer_token(auth_header: str):
+    """
+    Extract the token from an "Authorization: Bearer <token>" header value.
+    
+    Args:
+        auth_header: The Authorization header value
+        
+    Returns:
+        The token string, or None if the header is not a Bearer credential
+    """
+    # Fast path: "Bearer <token>" with a single space and an ASCII token free
+    # of SP/HTAB, the only whitespace allowed in HTTP field values (RFC 9110);
+    # a token carrying other control characters still fails verification
+    if auth_header[:7].lower() == 'bearer ':
+        token = auth_header[7:]
+        if token and token.isascii() and ' ' not in token and '\t' not in token:
+            return token
+    
+    # Anything else (tabs, extra spaces, other schemes) gets the same
+    # treatment as before: exactly two whitespace-separated parts
+    parts = auth_header.split()
+    if len(parts) != 2 or parts[0].lower() != 'bearer':
+        return None
+    return parts[1]
+
+
 def jwt_required(f):
     """
     Decorator for protecting routes with JWT authentication.
     
     This provides application-level JWT verification.
     Note: Kong also validates JWT at gateway level (defense in depth).
+    Claims are not taken from Kong-forwarded headers: the bundled jwt plugin
+    cannot forward them and no shipped Kong config (kong.yaml, Helm,
+    Terraform) sets up claim forwarding or a shared trust secret, so such a
+    fast path would be dormant header trust. Replayed tokens hit the
+    verification cache instead.
     
     Usage:
         @app.route('/protected')
@@ -149,12 +319,10 @@ def jwt_required(f):
             return jsonify({'error': 'Authorization header required'}), 401
         
         # Expected format: "Bearer <token>"
-        parts = auth_header.split()
-        if len(parts) != 2 or parts[0].lower() != 'bearer':
+        token = extract_bearer_token(auth_header)
+        if token is None:
             return jsonify({'error': 'Invalid authorization format. Use: Bearer <token>'}), 401
         
-        token = parts[1]
-        
         # Verify the token
         is_valid, result = verify_jwt_token(token)
         
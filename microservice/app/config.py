@@ -18,6 +18,7 @@ The secret is externalized (not hardcoded) for security best practices.
 """
 
 import os
+import warnings
 from datetime import timedelta
 
 
@@ -30,6 +31,31 @@ class Config:
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'dev-secret-change-in-production')
     JWT_ALGORITHM = 'HS256'
     JWT_EXPIRATION_HOURS = int(os.environ.get('JWT_EXPIRATION_HOURS', '24'))
+    JWT_EXPIRATION = timedelta(hours=JWT_EXPIRATION_HOURS)
+    
+    # Password Hashing Configuration
+    # Hasher for new passwords: 'bcrypt' (default) or 'argon2id'
+    PASSWORD_HASHERS = ('bcrypt', 'argon2id')
+    PASSWORD_HASHER = os.environ.get('PASSWORD_HASHER', 'bcrypt').lower()
+    if PASSWORD_HASHER not in PASSWORD_HASHERS:
+        raise ValueError(
+            f'Invalid PASSWORD_HASHER {PASSWORD_HASHER!r}; expected one of {PASSWORD_HASHERS}'
+        )
+    # argon2id memory per hash (KiB) and max concurrent argon2 hashes per process.
+    # Peak argon2 memory per pod = workers x ARGON2_MAX_CONCURRENT x ARGON2_MEMORY_COST
+    ARGON2_MEMORY_COST = int(os.environ.get('ARGON2_MEMORY_COST', '65536'))
+    if ARGON2_MEMORY_COST < 8:
+        # argon2 needs at least 8 KiB per lane (parallelism is 1)
+        raise ValueError(f'Invalid ARGON2_MEMORY_COST {ARGON2_MEMORY_COST}; expected at least 8')
+    ARGON2_MAX_CONCURRENT = int(os.environ.get('ARGON2_MAX_CONCURRENT', '1'))
+    if ARGON2_MAX_CONCURRENT < 1:
+        # 0 would make every argon2 hash wait forever on the semaphore
+        raise ValueError(f'Invalid ARGON2_MAX_CONCURRENT {ARGON2_MAX_CONCURRENT}; expected at least 1')
+    # bcrypt work factor (each +1 doubles hashing time); lower it only for dev/tests
+    # or very small CPU allocations
+    BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', '12'))
+    if not 4 <= BCRYPT_ROUNDS <= 31:
+        raise ValueError(f'Invalid BCRYPT_ROUNDS {BCRYPT_ROUNDS}; expected 4 to 31')
     
     # Database Configuration
     # SQLite database file path - persisted in container volume
@@ -42,6 +68,11 @@ class Config:
     
     @classmethod
     def get_jwt_expiration(cls):
-        """Get JWT expiration as timedelta."""
-        return timedelta(hours=cls.JWT_EXPIRATION_HOURS)
+        """Get JWT expiration as timedelta (deprecated: use JWT_EXPIRATION)."""
+        warnings.warn(
+            'Config.get_jwt_expiration() is deprecated, use Config.JWT_EXPIRATION',
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return cls.JWT_EXPIRATION
 
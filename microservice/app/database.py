@@ -3,7 +3,7 @@ Database module for SQLite operations.
 
 This module provides:
 - Database initialization with auto-creation of tables
-- Password hashing using bcrypt (industry standard)
+- Password hashing using bcrypt (industry standard) or argon2id
 - User CRUD operations
 
 Key Concept: SQLite
@@ -21,18 +21,48 @@ Passwords are NEVER stored in plain text. We use bcrypt which:
 - Automatically handles salt generation
 - Is designed to be slow (prevents brute force attacks)
 - Is adaptive (can increase work factor over time)
+
+argon2id (memory-hard) can be selected instead via PASSWORD_HASHER.
+Verification follows the stored hash's format, so existing bcrypt hashes
+keep working after switching.
 """
 
+import atexit
 import sqlite3
+import threading
+import weakref
 import bcrypt
 import os
+import pathlib
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 from contextlib import contextmanager
 from .config import Config
 
 
+# Short-lived cache of user lookups by username (absorbs repeated logins).
+# Only found users are cached, so unknown usernames cannot fill it.
+# The cache is per process: the TTL bounds how long other gunicorn workers
+# can keep serving a user record after it changes.
+_USER_CACHE_TTL = 5
+_user_cache = TTLCache(maxsize=1024, ttl=_USER_CACHE_TTL)
+_user_cache_lock = threading.Lock()
+
+# argon2id parameters: 2 passes over ARGON2_MEMORY_COST KiB (64 MiB by
+# default), single lane. The semaphore bounds how many hashes run at once,
+# since every gunicorn thread could otherwise allocate that memory together.
+_argon2_hasher = PasswordHasher(
+    time_cost=2,
+    memory_cost=Config.ARGON2_MEMORY_COST,
+    parallelism=1
+)
+_argon2_slots = threading.BoundedSemaphore(Config.ARGON2_MAX_CONCURRENT)
+
+
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using the configured hasher (Config.PASSWORD_HASHER).
     
     Args:
         password: Plain text password
@@ -40,9 +70,13 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password string (includes salt)
     """
+    if Config.PASSWORD_HASHER == 'argon2id':
+        with _argon2_slots:
+            return _argon2_hasher.hash(password)
+    
     # Generate salt and hash password
     # bcrypt automatically includes the salt in the output
-    salt = bcrypt.gensalt(rounds=12)  # 12 rounds is a good balance of security/speed
+    salt = bcrypt.gensalt(rounds=Config.BCRYPT_ROUNDS)  # 12 by default: a good balance of security/speed
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -58,23 +92,98 @@ def verify_password(password: str, hashed: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    if hashed.startswith('$argon2'):
+        try:
+            with _argon2_slots:
+                return _argon2_hasher.verify(hashed, password)
+        except (VerificationError, InvalidHashError):
+            return False
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
 
+class _Connection(sqlite3.Connection):
+    """sqlite3.Connection that supports weak references."""
+
+
+# One long-lived connection per thread (reused across requests)
+# Only weak references are tracked: when a thread exits, its thread-local
+# connection is garbage-collected and closed (e.g. with the dev server,
+# which starts a thread per request).
+_conn_local = threading.local()
+_open_connections = weakref.WeakSet()
+
+
+def _close_connections():
+    """Close every still-open per-thread connection at interpreter exit."""
+    for conn in list(_open_connections):
+        conn.close()
+
+
+atexit.register(_close_connections)
+
+
 @contextmanager
 def get_db_connection():
     """
     Context manager for database connections.
     
-    Ensures proper connection handling and cleanup.
+    Each thread keeps one persistent connection, so requests skip the
+    cost of opening the file and bootstrapping SQLite every time.
+    The connection runs in autocommit mode with WAL journaling; an
+    explicit transaction left open by an exception is rolled back.
     Uses Row factory for dict-like access to columns.
     """
-    conn = sqlite3.connect(Config.DATABASE_PATH)
-    conn.row_factory = sqlite3.Row  # Enables column access by name
+    conn = getattr(_conn_local, 'conn', None)
+    # A connection inherited across fork (e.g. gunicorn --preload) is not reused
+    if conn is None or _conn_local.pid != os.getpid():
+        conn = sqlite3.connect(
+            Config.DATABASE_PATH,
+            check_same_thread=False,
+            isolation_level=None,
+            factory=_Connection
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA cache_size=-20000')  # ~20MB page cache
+        conn.row_factory = sqlite3.Row  # Enables column access by name
+        _conn_local.conn = conn
+        _conn_local.pid = os.getpid()
+        _open_connections.add(conn)
     try:
         yield conn
-    finally:
-        conn.close()
+    except BaseException:
+        # Don't leave the persistent connection holding the write lock
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
+@contextmanager
+def get_db_connection_ro():
+    """
+    Context manager for read-only database connections.
+    
+    Same per-thread reuse as get_db_connection(), but opened with
+    mode=ro so SQLite never takes write locks; with WAL journaling,
+    readers never block on (or block) concurrent writers.
+    The database must already exist (init_db() runs at startup).
+    Rows are plain tuples (no Row factory).
+    """
+    conn = getattr(_conn_local, 'ro_conn', None)
+    if conn is None or _conn_local.ro_pid != os.getpid():
+        # as_uri() percent-escapes characters such as '?', '#' and '%'
+        db_uri = pathlib.Path(Config.DATABASE_PATH).resolve().as_uri()
+        conn = sqlite3.connect(
+            f'{db_uri}?mode=ro',
+            uri=True,
+            check_same_thread=False,
+            factory=_Connection
+        )
+        conn.execute('PRAGMA cache_size=-20000')  # ~20MB page cache
+        _conn_local.ro_conn = conn
+        _conn_local.ro_pid = os.getpid()
+        _open_connections.add(conn)
+    yield conn
 
 
 def init_db():
@@ -117,12 +226,16 @@ def init_db():
                 ('user1', 'user1@example.com', 'password1'),
                 ('user2', 'user2@example.com', 'password2'),
             ]
-            for username, email, password in sample_users:
-                password_hash = get_password_hash(password)
-                cursor.execute(
-                    'INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)',
-                    (username, email, password_hash)
-                )
+            rows = [
+                (username, email, get_password_hash(password))
+                for username, email, password in sample_users
+            ]
+            # Single transaction for all seed rows (connection is autocommit)
+            cursor.execute('BEGIN')
+            cursor.executemany(
+                'INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)',
+                rows
+            )
             print(f"Database initialized with {len(sample_users)} sample users")
         
         conn.commit()
@@ -137,15 +250,51 @@ def get_user_by_username(username: str) -> dict:
         username: The username to search for
         
     Returns:
-        User dict or None if not found
+        User dict (id, username, email, password_hash) or None if not found
+    
+    Results are cached for a few seconds; call invalidate_user_cache()
+    after changing a user.
     """
+    with _user_cache_lock:
+        user = _user_cache.get(username)
+    if user is not None:
+        return user
+    
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute('SELECT * FROM users WHERE username = ?', (username,))
+        # Only the columns /login needs; the statement stays in the
+        # connection's prepared-statement cache across requests
+        cursor.execute(
+            'SELECT id, username, email, password_hash FROM users WHERE username = ? LIMIT 1',
+            (username,)
+        )
         row = cursor.fetchone()
-        if row:
-            return dict(row)
+    if row is None:
         return None
+    
+    user = dict(row)
+    with _user_cache_lock:
+        _user_cache[username] = user
+    return user
+
+
+def invalidate_user_cache(username: str = None):
+    """
+    Drop cached user lookups in the current process.
+    
+    Must be called by any operation that modifies users. Other worker
+    processes have their own caches and keep serving the old record
+    (including its password hash) until their entry expires, i.e. for up
+    to _USER_CACHE_TTL seconds.
+    
+    Args:
+        username: Username to evict, or None to clear the whole cache
+    """
+    with _user_cache_lock:
+        if username is None:
+            _user_cache.clear()
+        else:
+            _user_cache.pop(username, None)
 
 
 def get_all_users() -> list:
@@ -155,8 +304,12 @@ def get_all_users() -> list:
     Returns:
         List of user dicts (id, username, email, created_at)
     """
-    with get_db_connection() as conn:
+    with get_db_connection_ro() as conn:
         cursor = conn.cursor()
+        # Plain tuples: no sqlite3.Row and then a dict per row
         cursor.execute('SELECT id, username, email, created_at FROM users')
-        return [dict(row) for row in cursor.fetchall()]
+        return [
+            {'id': user_id, 'username': username, 'email': email, 'created_at': created_at}
+            for user_id, username, email, created_at in cursor
+        ]
 
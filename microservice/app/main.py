@@ -16,10 +16,77 @@ to the application factory pattern for larger applications:
 - Supports multiple app instances
 """
 
-from flask import Flask, jsonify
+import orjson
+from flask import Flask, Response, jsonify
+from flask.json.provider import DefaultJSONProvider
 from .config import Config
 from .database import init_db
-from .routes import api
+from .routes import api, HEALTH_BODY
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Used by jsonify() and request.get_json(). Keeps Flask's sort_keys
+    and debug indentation behaviour, non-string dict keys, and HTTP-date
+    formatting of dates (datetimes are passed through to Flask's default
+    serializer, as are types orjson does not handle natively).
+    
+    Differences from Flask's provider: non-ASCII text is emitted as UTF-8
+    instead of \\uXXXX escapes, and ensure_ascii is ignored.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# Constant responses, serialized once (same bytes jsonify would produce)
+_ROOT_BODY = orjson.dumps(
+    {
+        'service': 'user-service',
+        'version': '1.0.0',
+        'endpoints': {
+            'health': '/health',
+            'login': '/login',
+            'verify': '/verify',
+            'users': '/users (requires JWT)'
+        }
+    },
+    option=orjson.OPT_SORT_KEYS
+) + b'\n'
+_HEALTH_LENGTH = str(len(HEALTH_BODY))
+
+
+class HealthCheckMiddleware:
+    """
+    WSGI middleware that answers GET /health before Flask dispatch.
+    
+    Kubernetes probes hit /health constantly; the response is constant,
+    so URL routing, request context setup and JSON encoding are skipped.
+    All other requests are passed through unchanged.
+    """
+    
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+    
+    def __call__(self, environ, start_response):
+        if environ.get('PATH_INFO') == '/health' and environ.get('REQUEST_METHOD') == 'GET':
+            # Fresh list per call: servers may mutate the headers they are given
+            start_response('200 OK', [
+                ('Content-Type', 'application/json'),
+                ('Content-Length', _HEALTH_LENGTH)
+            ])
+            return [HEALTH_BODY]
+        return self.wsgi_app(environ, start_response)
 
 
 def create_app():
@@ -34,11 +101,23 @@ def create_app():
     # Load configuration
     app.config.from_object(Config)
     
+    # Use orjson for all JSON responses and request bodies
+    app.json = OrjsonProvider(app)
+    
+    # Routing: the service only has a handful of static routes, so skip
+    # Werkzeug's trailing-slash redirects and duplicate-slash merging.
+    # Must be set before any route is registered (rules copy it on bind).
+    app.url_map.strict_slashes = False
+    app.url_map.merge_slashes = False
+    
     # Register API blueprint at root level
     # Routes will be accessible at /health, /login, /users, etc.
     # Kong will route to these endpoints
     app.register_blueprint(api)
     
+    # Serve health probes without going through Flask
+    app.wsgi_app = HealthCheckMiddleware(app.wsgi_app)
+    
     # Global error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -51,16 +130,7 @@ def create_app():
     # Root endpoint
     @app.route('/')
     def root():
-        return jsonify({
-            'service': 'user-service',
-            'version': '1.0.0',
-            'endpoints': {
-                'health': '/health',
-                'login': '/login',
-                'verify': '/verify',
-                'users': '/users (requires JWT)'
-            }
-        })
+        return Response(_ROOT_BODY, mimetype='application/json')
     
     return app
 
@@ -29,13 +29,21 @@ Routes like /health are essential for:
 These must NOT require authentication.
 """
 
-from flask import Blueprint, request, jsonify
+import orjson
+from flask import Blueprint, Response, request, jsonify
 from .database import get_user_by_username, get_all_users, verify_password
-from .auth import create_jwt_token, verify_jwt_token, jwt_required
+from .auth import create_jwt_token, verify_jwt_token, jwt_required, extract_bearer_token
 
 # Create blueprint for API routes
 api = Blueprint('api', __name__)
 
+# Constant health response, serialized once (same bytes jsonify would produce);
+# also served by HealthCheckMiddleware in main.py
+HEALTH_BODY = orjson.dumps(
+    {'status': 'healthy', 'service': 'user-service', 'version': '1.0.0'},
+    option=orjson.OPT_SORT_KEYS
+) + b'\n'
+
 
 # ============================================================================
 # PUBLIC APIs (No Authentication Required)
@@ -57,11 +65,7 @@ def health_check():
     Returns:
         200 OK with status information
     """
-    return jsonify({
-        'status': 'healthy',
-        'service': 'user-service',
-        'version': '1.0.0'
-    }), 200
+    return Response(HEALTH_BODY, status=200, mimetype='application/json')
 
 
 @api.route('/verify', methods=['GET'])
@@ -88,9 +92,7 @@ def verify_token():
     token = request.args.get('token')
     
     if not token:
-        auth_header = request.headers.get('Authorization', '')
-        if auth_header.startswith('Bearer '):
-            token = auth_header[7:]
+        token = extract_bearer_token(request.headers.get('Authorization', ''))
     
     if not token:
         return jsonify({
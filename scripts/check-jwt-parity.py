@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# =============================================================================
+# JWT Decoder Parity Check
+# =============================================================================
+# The user service verifies HS256 tokens with its own minimal decoder
+# (microservice/app/auth.py) instead of PyJWT. This script feeds the same
+# tokens to both and checks they accept/reject them identically
+# (same payload, or same exception type).
+#
+# Known, intentional difference: the service decodes base64url strictly
+# (pybase64, validate=True), while PyJWT silently drops non-alphabet
+# characters. Those tokens must be rejected by the service with DecodeError.
+#
+# Run: python scripts/check-jwt-parity.py   (needs microservice/requirements.txt)
+# =============================================================================
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'microservice'))
+
+import jwt  # noqa: E402
+from app.auth import decode_jwt_token  # noqa: E402
+from app.config import Config  # noqa: E402
+
+KEY = Config.JWT_SECRET_KEY
+NOW = int(time.time())
+CLAIMS = {'sub': '1', 'username': 'admin', 'iat': NOW, 'exp': NOW + 3600, 'iss': 'user-service'}
+
+
+def sign(payload, key=KEY, algorithm='HS256', headers=None):
+    return jwt.encode(payload, key, algorithm=algorithm, headers=headers)
+
+
+def claims(**changes):
+    payload = dict(CLAIMS, **changes)
+    return {k: v for k, v in payload.items() if v is not None}
+
+
+valid = sign(CLAIMS)
+header, payload, signature = valid.split('.')
+
+CASES = {
+    # Well-formed tokens
+    'valid token': valid,
+    'non-ASCII claim': sign(claims(username='jürgen')),
+    'numeric-string exp': sign(claims(exp=str(NOW + 3600))),
+    'empty aud': sign(claims(aud='')),
+    # Malformed segments
+    'single segment': 'abc',
+    'two segments': 'abc.def',
+    'four segments': valid + '.extra',
+    'empty token': '',
+    'payload not an object': jwt.api_jws.encode(b'[1,2]', KEY, algorithm='HS256'),
+    # Bad padding / encoding
+    'bad signature padding': f'{header}.{payload}.{signature[:-1]}',
+    'bad payload padding': f'{header}.{payload[:-1]}.{signature}',
+    'non-base64 header': f'{header}!.{payload}.{signature}',
+    'non-base64 signature': f'{header}.{payload}.{signature}!',
+    'invalid header json': f'e30x.{payload}.{signature}',
+    # Signature / algorithm
+    'wrong key': sign(CLAIMS, key='other-secret'),
+    'tampered payload': f'{header}.{sign(claims(sub="2")).split(".")[1]}.{signature}',
+    'alg none': sign(CLAIMS, key=None, algorithm='none'),
+    'alg HS512': sign(CLAIMS, algorithm='HS512'),
+    'extra header field': sign(CLAIMS, headers={'kid': 'k1'}),
+    # Claims
+    'missing sub': sign(claims(sub=None)),
+    'missing iat': sign(claims(iat=None)),
+    'missing exp': sign(claims(exp=None)),
+    'future iat': sign(claims(iat=NOW + 3600)),
+    'future nbf': sign(claims(nbf=NOW + 3600)),
+    'past nbf': sign(claims(nbf=NOW - 10)),
+    'expired exp': sign(claims(exp=NOW - 10)),
+    'non-integer exp': sign(claims(exp='soon')),
+    'foreign aud': sign(claims(aud='other')),
+    'expired + foreign aud': sign(claims(exp=NOW - 10, aud='other')),
+}
+
+# Cases where the service is deliberately stricter than PyJWT
+STRICTER = {'non-base64 header', 'non-base64 signature'}
+
+
+def outcome(decode, token):
+    try:
+        return 'accepted', decode(token)
+    except jwt.InvalidTokenError as e:
+        return 'rejected', type(e).__name__
+
+
+def main():
+    failed = 0
+    for name, token in CASES.items():
+        expected = outcome(
+            lambda t: jwt.decode(t, KEY, algorithms=['HS256'], options={'require': ['exp', 'iat', 'sub']}),
+            token
+        )
+        actual = outcome(decode_jwt_token, token)
+        if name in STRICTER and actual == ('rejected', 'DecodeError'):
+            print(f'PASSED - {name}: rejected (DecodeError; PyJWT {expected[0]}, service is stricter)')
+        elif expected == actual:
+            print(f'PASSED - {name}: {actual[0]} ({actual[1] if actual[0] == "rejected" else "payload matches"})')
+        else:
+            failed += 1
+            print(f'FAILED - {name}: PyJWT {expected}, service {actual}')
+    print(f'\n{len(CASES) - failed}/{len(CASES)} cases match PyJWT')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())